@@ -12,6 +12,7 @@ import torch
 
 from allennlp.common.checks import ConfigurationError
 from allennlp.common.util import ensure_list
+from allennlp.data.fields.field import Field
 from allennlp.data.instance import Instance
 from allennlp.data.vocabulary import Vocabulary
 
@@ -133,22 +134,37 @@ class Batch(Iterable):
                 else:
                     lengths_to_use[field_name][padding_key] = instance_field_lengths[padding_key]
 
-        # Now we actually pad the instances to tensors.
+        # Now we actually pad the instances to tensors.  Some fields know how to batch
+        # themselves directly, without building a tensor per instance first.
+        field_classes = self.instances[0].fields
+        batched_tensors = {}
+        for field_name, field in field_classes.items():
+            if type(field).batch_fields_directly is Field.batch_fields_directly:
+                continue
+            batched_tensor = field.batch_fields_directly(
+                [instance.fields[field_name] for instance in self.instances],
+                lengths_to_use[field_name],
+            )
+            if batched_tensor is not None:
+                batched_tensors[field_name] = batched_tensor
+
         field_tensors: Dict[str, list] = defaultdict(list)
         if verbose:
             logger.info(f"Now actually padding instances to length: {lengths_to_use}")
         for instance in self.instances:
-            for field, tensors in instance.as_tensor_dict(lengths_to_use).items():
-                field_tensors[field].append(tensors)
+            for field_name, field in instance.fields.items():
+                if field_name not in batched_tensors:
+                    field_tensors[field_name].append(field.as_tensor(lengths_to_use[field_name]))
 
         # Finally, we combine the tensors that we got for each instance into one big tensor (or set
         # of tensors) per field.  The `Field` classes themselves have the logic for batching the
         # tensors together, so we grab a dictionary of field_name -> field class from the first
         # instance in the batch.
-        field_classes = self.instances[0].fields
         return {
-            field_name: field_classes[field_name].batch_tensors(field_tensor_list)
-            for field_name, field_tensor_list in field_tensors.items()
+            field_name: batched_tensors[field_name]
+            if field_name in batched_tensors
+            else field_classes[field_name].batch_tensors(field_tensors[field_name])
+            for field_name in field_classes
         }
 
     def __iter__(self) -> Iterator[Instance]:
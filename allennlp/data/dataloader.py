@@ -1,4 +1,6 @@
-from typing import List, Dict, Union, Iterator
+from typing import Any, List, Dict, Union, Iterator
+import queue
+import threading
 
 import torch
 from torch.utils import data
@@ -18,6 +20,58 @@ def allennlp_collate(instances: List[Instance]) -> TensorDict:
     return batch.as_tensor_dict(batch.get_padding_lengths())
 
 
+def _prefetch_batches(
+    batches: Iterator[TensorDict], num_prefetch_batches: int
+) -> Iterator[TensorDict]:
+    """
+    Pulls batches from `batches` on a background thread, keeping up to `num_prefetch_batches`
+    of them ready in a bounded queue, so that the next batch is collated while the consumer
+    is busy with the current one.
+    """
+    batch_queue: queue.Queue = queue.Queue(maxsize=num_prefetch_batches)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        # Time out regularly so that we notice when the consumer has gone away,
+        # instead of blocking forever on a full queue.
+        while not stop.is_set():
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put((batch, None)):
+                    return
+        except Exception as e:
+            put((None, e))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                batch, error = batch_queue.get(timeout=0.1)
+            except queue.Empty:
+                if not thread.is_alive() and batch_queue.empty():
+                    raise RuntimeError("Batch prefetching thread exited unexpectedly")
+                continue
+            if error is not None:
+                raise error
+            if batch is done:
+                return
+            yield batch
+    finally:
+        stop.set()
+
+
 class DataLoader(Registrable):
     """
     A `DataLoader` is responsible for generating batches of instances from a `Dataset`,
@@ -62,6 +116,20 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
     through your data.  You might use this if you have a very large dataset and want more frequent
     checkpoints and evaluations on validation data, for instance.
 
+    Thirdly, this class adds a `num_prefetch_batches` parameter which only applies when
+    `num_workers` is `0`.  If it is greater than `0`, batches are collated on a background thread,
+    and up to `num_prefetch_batches` of them are kept ready while the model works on the current
+    one.  It is disabled by default because the thread shares the global random number generators
+    with the main thread, so shuffling is no longer reproducible from a fixed seed.  When
+    `num_workers` is greater than `0`, the worker processes already do this prefetching.  Note
+    that this is unrelated to the `prefetch_factor` parameter of torch's `DataLoader`, which
+    controls the number of batches loaded in advance by each worker.
+
+    Finally, `persistent_workers` is passed through to torch's `DataLoader` (it requires
+    torch 1.7 or later).  When it is `True` and `num_workers` is greater than `0`, the worker
+    processes are started once and reused for every epoch instead of being re-created each
+    time the loader is iterated over.
+
     In a typical AllenNLP configuration file, the `dataset` parameter does not get an entry under
     the "data_loader", it gets constructed separately.
     """
@@ -84,7 +152,12 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
         worker_init_fn=None,
         multiprocessing_context: str = None,
         batches_per_epoch: int = None,
+        num_prefetch_batches: int = 0,
+        persistent_workers: bool = False,
     ):
+        # `persistent_workers` was only added to torch's DataLoader in version 1.7, so we only
+        # pass it through when it's set in order to keep working with torch 1.6.
+        extra_kwargs: Dict[str, Any] = {"persistent_workers": True} if persistent_workers else {}
         super().__init__(
             dataset=dataset,
             batch_size=batch_size,
@@ -98,9 +171,11 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
             timeout=timeout,
             worker_init_fn=worker_init_fn,
             multiprocessing_context=multiprocessing_context,
+            **extra_kwargs,
         )
-        self._data_generator = super().__iter__()
         self._batches_per_epoch = batches_per_epoch
+        self._num_prefetch_batches = num_prefetch_batches
+        self._data_generator = self._iter_batches()
 
     def __len__(self):
         if self._batches_per_epoch is not None:
@@ -109,18 +184,24 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
 
     def __iter__(self):
         if self._batches_per_epoch is None:
-            # NOTE: since torch's DataLoader is listed as the first super class of this class,
-            # super().__iter__() will resolve to the __iter__ method from torch's DataLoader,
-            # which is what we want.
-            yield from super().__iter__()
+            yield from self._iter_batches()
         else:
             for i in range(self._batches_per_epoch):
                 try:
                     yield next(self._data_generator)
                 except StopIteration:  # data_generator is exhausted
-                    self._data_generator = super().__iter__()  # so refresh it
+                    self._data_generator = self._iter_batches()  # so refresh it
                     yield next(self._data_generator)  # and yield required instance
 
+    def _iter_batches(self) -> Iterator[TensorDict]:
+        # NOTE: since torch's DataLoader is listed as the first super class of this class,
+        # super().__iter__() will resolve to the __iter__ method from torch's DataLoader,
+        # which is what we want.
+        batches = super().__iter__()
+        if self.num_workers == 0 and self._num_prefetch_batches > 0:
+            return _prefetch_batches(batches, self._num_prefetch_batches)
+        return batches
+
     @classmethod
     def from_partial_objects(
         cls,
@@ -136,6 +217,8 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
         worker_init_fn=None,
         multiprocessing_context: str = None,
         batches_per_epoch: int = None,
+        num_prefetch_batches: int = 0,
+        persistent_workers: bool = False,
     ) -> "PyTorchDataLoader":
         batch_sampler_ = (
             None if batch_sampler is None else batch_sampler.construct(data_source=dataset)
@@ -159,4 +242,6 @@ class PyTorchDataLoader(data.DataLoader, DataLoader):
             worker_init_fn=worker_init_fn,
             multiprocessing_context=multiprocessing_context,
             batches_per_epoch=batches_per_epoch,
+            num_prefetch_batches=num_prefetch_batches,
+            persistent_workers=persistent_workers,
         )
@@ -29,11 +29,19 @@ class AllennlpDataset(Dataset):
     def __init__(self, instances: List[Instance], vocab: Vocabulary = None):
         self.instances = instances
         self.vocab = vocab
+        # Set by `index_with()` once every instance has been indexed, after which
+        # `__getitem__` doesn't have to check anything.
+        self._indexed_all = False
 
     def __getitem__(self, idx) -> Instance:
-        if self.vocab is not None:
-            self.instances[idx].index_fields(self.vocab)
-        return self.instances[idx]
+        instance = self.instances[idx]
+        if self._indexed_all:
+            return instance
+        # Instances are cached for the lifetime of the dataset, so each one only ever needs
+        # to be indexed once. Checking the flag here skips the method call on later epochs.
+        if self.vocab is not None and not instance.indexed:
+            instance.index_fields(self.vocab)
+        return instance
 
     def __len__(self):
         return len(self.instances)
@@ -48,6 +56,13 @@ class AllennlpDataset(Dataset):
 
     def index_with(self, vocab: Vocabulary):
         self.vocab = vocab
+        # All of the instances are already in memory, so we index them in a single pass here
+        # instead of one at a time in `__getitem__`. This also means that worker processes
+        # of a multi-process `DataLoader` inherit indexed instances, rather than re-indexing
+        # their own copies on every epoch.
+        for instance in self.instances:
+            instance.index_fields(vocab)
+        self._indexed_all = True
 
 
 class AllennlpLazyDataset(IterableDataset):
@@ -77,10 +92,13 @@ class AllennlpLazyDataset(IterableDataset):
         self.vocab = vocab
 
     def __iter__(self) -> Iterator[Instance]:
-        for instance in self._instance_generator(self._file_path):
-            if self.vocab is not None:
-                instance.index_fields(self.vocab)
-            yield instance
+        vocab = self.vocab
+        if vocab is None:
+            yield from self._instance_generator(self._file_path)
+        else:
+            for instance in self._instance_generator(self._file_path):
+                instance.index_fields(vocab)
+                yield instance
 
     def index_with(self, vocab: Vocabulary):
         self.vocab = vocab
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Dict, Generic, List, TypeVar
+from typing import Dict, Generic, List, Optional, TypeVar
 
 import torch
 
@@ -116,6 +116,21 @@ class Field(Generic[DataArray]):
 
         return torch.stack(tensor_list)
 
+    def batch_fields_directly(
+        self, field_list: List["Field"], padding_lengths: Dict[str, int]
+    ) -> Optional[DataArray]:
+        """
+        An optional shortcut for batching.  Takes this field from every `Instance` in a batch
+        (`self` is the first of them) and returns the same batched tensor that calling
+        `as_tensor()` on each field followed by `batch_tensors()` would, without creating a tensor
+        for every instance along the way.
+
+        The default implementation returns `None`, which means that the shortcut isn't supported,
+        and the batch goes through `as_tensor()` and `batch_tensors()` as usual.  Subclasses that
+        override this can also return `None` for any batch they can't handle this way.
+        """
+        return None
+
     def __eq__(self, other) -> bool:
         if isinstance(self, other.__class__):
             # With the way "slots" classes work, self.__slots__ only gives the slots defined
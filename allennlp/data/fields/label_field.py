@@ -1,4 +1,4 @@
-from typing import Dict, Union, Set
+from typing import Dict, List, Optional, Union, Set, cast
 import logging
 
 from overrides import overrides
@@ -101,6 +101,19 @@ class LabelField(Field[torch.Tensor]):
         tensor = torch.tensor(self._label_id, dtype=torch.long)
         return tensor
 
+    @overrides
+    def batch_fields_directly(
+        self, field_list: List[Field], padding_lengths: Dict[str, int]
+    ) -> Optional[torch.Tensor]:
+        # Subclasses might turn labels into tensors differently, so we only handle this class.
+        if not all(type(field) is LabelField for field in field_list):
+            return None
+        label_ids = [field._label_id for field in cast(List[LabelField], field_list)]
+        if any(label_id is None for label_id in label_ids):
+            # Let `as_tensor()` deal with fields that haven't been indexed.
+            return None
+        return torch.tensor(label_ids, dtype=torch.long)
+
     @overrides
     def empty_field(self):
         return LabelField(-1, self._label_namespace, skip_indexing=True)
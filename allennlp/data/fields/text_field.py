@@ -4,7 +4,7 @@ standard word vectors, or pass through an LSTM.
 """
 from collections import defaultdict
 from copy import deepcopy
-from typing import Dict, List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator, cast
 import textwrap
 
 from overrides import overrides
@@ -12,6 +12,7 @@ from spacy.tokens import Token as SpacyToken
 import torch
 
 from allennlp.common.checks import ConfigurationError
+from allennlp.data.fields.field import Field
 from allennlp.data.fields.sequence_field import SequenceField
 from allennlp.data.tokenizers import Token
 from allennlp.data.token_indexers.token_indexer import TokenIndexer, IndexedTokenList
@@ -138,6 +139,46 @@ class TextField(SequenceField[TextFieldTensors]):
         }
         return batched_tensors
 
+    @overrides
+    def batch_fields_directly(
+        self, field_list: List[Field], padding_lengths: Dict[str, int]
+    ) -> Optional[TextFieldTensors]:
+        # Subclasses might turn tokens into tensors differently, so we only handle this class.
+        if not all(type(field) is TextField for field in field_list):
+            return None
+        # Check the indexers first, so we don't scan the batch or build tensors for nothing.
+        if not all(indexer.can_batch_directly() for indexer in self._token_indexers.values()):
+            return None
+        text_fields = cast(List[TextField], field_list)
+        for text_field in text_fields:
+            if text_field._indexed_tokens is None:
+                # Let `as_tensor()` deal with fields that haven't been indexed.
+                return None
+            if (
+                text_field._token_indexers is not self._token_indexers
+                and text_field._token_indexers != self._token_indexers
+            ):
+                return None
+
+        indexer_lengths: Dict[str, Dict[str, int]] = defaultdict(dict)
+        for key, value in padding_lengths.items():
+            indexer_name, padding_key = key.split("___")
+            indexer_lengths[indexer_name][padding_key] = value
+
+        batched_tensors = {}
+        for indexer_name, indexer in self._token_indexers.items():
+            indexer_tensors = indexer.as_padded_batch_tensor_dict(
+                [
+                    cast(Dict[str, IndexedTokenList], text_field._indexed_tokens)[indexer_name]
+                    for text_field in text_fields
+                ],
+                indexer_lengths[indexer_name],
+            )
+            if indexer_tensors is None:
+                return None
+            batched_tensors[indexer_name] = indexer_tensors
+        return batched_tensors
+
     def __str__(self) -> str:
         indexers = {
             name: indexer.__class__.__name__ for name, indexer in self._token_indexers.items()
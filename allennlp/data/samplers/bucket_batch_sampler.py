@@ -118,8 +118,7 @@ class BucketBatchSampler(BatchSampler):
     def __iter__(self) -> Iterable[List[int]]:
         indices, _ = self._argsort_by_padding(self.data_source)
         batches = []
-        for group in lazy_groups_of(indices, self.batch_size):
-            batch_indices = list(group)
+        for batch_indices in lazy_groups_of(indices, self.batch_size):
             if self.drop_last and len(batch_indices) < self.batch_size:
                 continue
             batches.append(batch_indices)
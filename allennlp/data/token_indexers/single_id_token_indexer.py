@@ -2,6 +2,8 @@ from typing import Dict, List, Optional
 import itertools
 
 from overrides import overrides
+import numpy
+import torch
 
 from allennlp.data.vocabulary import Vocabulary
 from allennlp.data.tokenizers import Token
@@ -97,6 +99,28 @@ class SingleIdTokenIndexer(TokenIndexer):
     def get_empty_token_list(self) -> IndexedTokenList:
         return {"tokens": []}
 
+    @overrides
+    def can_batch_directly(self) -> bool:
+        # Subclasses might index or pad tokens differently, so we only handle this class.  Without
+        # a namespace the values come straight from the tokens and might be bools, which
+        # `as_padded_tensor_dict()` turns into a `BoolTensor`, so we leave those to it as well.
+        return type(self) is SingleIdTokenIndexer and self.namespace is not None
+
+    @overrides
+    def as_padded_batch_tensor_dict(
+        self, tokens_list: List[IndexedTokenList], padding_lengths: Dict[str, int]
+    ) -> Optional[Dict[str, torch.Tensor]]:
+        if not self.can_batch_directly():
+            return None
+        # Token ids are written straight into one preallocated array, instead of building a
+        # tensor per instance and stacking them.
+        length = padding_lengths["tokens"]
+        array = numpy.zeros((len(tokens_list), length), dtype=numpy.int64)
+        for i, indexed_tokens in enumerate(tokens_list):
+            token_ids = indexed_tokens["tokens"][:length]
+            array[i, : len(token_ids)] = token_ids
+        return {"tokens": torch.from_numpy(array)}
+
     def _get_feature_value(self, token: Token) -> str:
         text = getattr(token, self._feature_name)
         if text is None:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import torch
 
@@ -119,6 +119,26 @@ class TokenIndexer(Registrable):
             tensor_dict[key] = tensor
         return tensor_dict
 
+    def as_padded_batch_tensor_dict(
+        self, tokens_list: List[IndexedTokenList], padding_lengths: Dict[str, int]
+    ) -> Optional[Dict[str, torch.Tensor]]:
+        """
+        An optional shortcut used by `TextField.batch_fields_directly()`.  Takes the indexed
+        tokens of every instance in a batch and returns what calling `as_padded_tensor_dict()` on
+        each of them and stacking the results would, without creating a tensor per instance.
+
+        The default implementation returns `None`, which means that the shortcut isn't supported.
+        Indexers that override this should also override `can_batch_directly()`.
+        """
+        return None
+
+    def can_batch_directly(self) -> bool:
+        """
+        Returns whether `as_padded_batch_tensor_dict()` will batch this indexer's output, so that
+        `TextField` can tell up front whether to try the shortcut at all.  The default is `False`.
+        """
+        return False
+
     def __eq__(self, other) -> bool:
         if isinstance(self, other.__class__):
             return self.__dict__ == other.__dict__
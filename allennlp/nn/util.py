@@ -34,28 +34,42 @@ def has_tensor(obj) -> bool:
         return False
 
 
-def move_to_device(obj, cuda_device: Union[torch.device, int]):
+def move_to_device(obj, cuda_device: Union[torch.device, int], non_blocking: bool = False):
     """
     Given a structure (possibly) containing Tensors on the CPU,
     move all the Tensors to the specified GPU (or do nothing, if they should be on the CPU).
+
+    If `non_blocking` is `True` and the tensors are in pinned memory, the copies are issued
+    asynchronously with respect to the host, so the CPU can carry on (e.g. launching the
+    model's kernels) while the data is transferred.
     """
     from allennlp.common.util import int_to_device
 
     cuda_device = int_to_device(cuda_device)
 
-    if cuda_device == torch.device("cpu") or not has_tensor(obj):
+    if cuda_device == torch.device("cpu"):
+        return obj
+    return _move_to_device(obj, cuda_device, non_blocking)
+
+
+def _move_to_device(obj, cuda_device: torch.device, non_blocking: bool):
+    # The device has already been normalized by `move_to_device`, so we don't redo that
+    # for every object in the structure.
+    if not has_tensor(obj):
         return obj
     elif isinstance(obj, torch.Tensor):
-        return obj.cuda(cuda_device)
+        return obj.cuda(cuda_device, non_blocking=non_blocking)
     elif isinstance(obj, dict):
-        return {key: move_to_device(value, cuda_device) for key, value in obj.items()}
+        return {
+            key: _move_to_device(value, cuda_device, non_blocking) for key, value in obj.items()
+        }
     elif isinstance(obj, list):
-        return [move_to_device(item, cuda_device) for item in obj]
+        return [_move_to_device(item, cuda_device, non_blocking) for item in obj]
     elif isinstance(obj, tuple) and hasattr(obj, "_fields"):
         # This is the best way to detect a NamedTuple, it turns out.
-        return obj.__class__(*(move_to_device(item, cuda_device) for item in obj))
+        return obj.__class__(*(_move_to_device(item, cuda_device, non_blocking) for item in obj))
     elif isinstance(obj, tuple):
-        return tuple(move_to_device(item, cuda_device) for item in obj)
+        return tuple(_move_to_device(item, cuda_device, non_blocking) for item in obj)
     else:
         return obj
 
@@ -554,6 +554,10 @@ class GradientDescentTrainer(Trainer):
 
         self._num_gradient_accumulation_steps = num_gradient_accumulation_steps
 
+        # Whether batches need to be moved at all is fixed for the lifetime of the trainer,
+        # so we decide it once here instead of on every batch.
+        self._move_batches_to_device = self.cuda_device != torch.device("cpu")
+
         # Enable automatic mixed precision training.
         self._scaler: Optional[amp.GradScaler] = None
         self._use_amp = use_amp
@@ -600,7 +604,10 @@ class GradientDescentTrainer(Trainer):
         Does a forward pass on the given batch and returns the output dictionary that the model
         returns, after adding any specified regularization penalty to the loss (if training).
         """
-        batch = nn_util.move_to_device(batch, self.cuda_device)
+        if self._move_batches_to_device:
+            # If the data loader pins memory, this lets the host-to-device copy overlap with
+            # the CPU work of launching the forward pass.
+            batch = nn_util.move_to_device(batch, self.cuda_device, non_blocking=True)
         output_dict = self._pytorch_model(**batch)
 
         if for_training:
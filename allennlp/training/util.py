@@ -366,7 +366,7 @@ def evaluate(
 
         for batch in generator_tqdm:
             batch_count += 1
-            batch = nn_util.move_to_device(batch, cuda_device)
+            batch = nn_util.move_to_device(batch, cuda_device, non_blocking=True)
             output_dict = model(**batch)
             loss = output_dict.get("loss")
 
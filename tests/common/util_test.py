@@ -36,6 +36,19 @@ class TestCommonUtils(AllenNlpTestCase):
         with pytest.raises(StopIteration):
             _ = next(groups)
 
+    def test_lazy_groups_of_list(self):
+        xs = [1, 2, 3, 4, 5, 6, 7]
+        groups = util.lazy_groups_of(xs, group_size=3)
+        assert next(groups) == [1, 2, 3]
+        assert next(groups) == [4, 5, 6]
+        assert next(groups) == [7]
+        with pytest.raises(StopIteration):
+            _ = next(groups)
+        assert list(util.lazy_groups_of([], group_size=3)) == []
+        # A list and an iterator over it give the same result, even for a group size of 0.
+        assert list(util.lazy_groups_of(xs, group_size=0)) == []
+        assert list(util.lazy_groups_of(iter(xs), group_size=0)) == []
+
     def test_pad_sequence_to_length(self):
         assert util.pad_sequence_to_length([1, 2, 3], 5) == [1, 2, 3, 0, 0]
         assert util.pad_sequence_to_length([1, 2, 3], 5, default_value=lambda: 2) == [1, 2, 3, 2, 2]
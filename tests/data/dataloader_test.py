@@ -1,6 +1,8 @@
+import inspect
 from typing import Iterable
 
 import pytest
+from torch.utils import data
 
 from allennlp.data.fields import LabelField
 from allennlp.data.instance import Instance
@@ -44,3 +46,60 @@ def test_loader_uses_all_instances_when_batches_per_epochs_set(lazy):
         # Epoch 3.
         [[18, 19], [0, 1], [2, 3]],
     ]
+
+
+@pytest.mark.parametrize("lazy", (True, False))
+def test_loader_with_prefetching_yields_same_batches(lazy):
+    class FakeDatasetReader(DatasetReader):
+        def _read(self, filename: str) -> Iterable[Instance]:
+            for i in range(10):
+                yield Instance({"index": LabelField(i, skip_indexing=True)})
+
+    reader = FakeDatasetReader(lazy=lazy)
+    dataset = reader.read("blah")
+
+    loader = PyTorchDataLoader(dataset, batch_size=3)
+    prefetching_loader = PyTorchDataLoader(dataset, batch_size=3, num_prefetch_batches=2)
+    for _ in range(2):
+        batches = [batch["index"].tolist() for batch in loader]
+        prefetched_batches = [batch["index"].tolist() for batch in prefetching_loader]
+        assert prefetched_batches == batches == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+
+def test_loader_with_prefetching_raises_errors_from_the_background_thread():
+    class FakeDatasetReader(DatasetReader):
+        def _read(self, filename: str) -> Iterable[Instance]:
+            yield Instance({"index": LabelField(0, skip_indexing=True)})
+            raise ValueError("bad instance")
+
+    reader = FakeDatasetReader(lazy=True)
+    dataset = reader.read("blah")
+
+    loader = PyTorchDataLoader(dataset, batch_size=1, num_prefetch_batches=2)
+    with pytest.raises(ValueError, match="bad instance"):
+        list(loader)
+
+
+@pytest.mark.skipif(
+    "persistent_workers" not in inspect.signature(data.DataLoader.__init__).parameters,
+    reason="persistent_workers requires torch 1.7 or later",
+)
+def test_loader_with_persistent_workers_yields_same_batches():
+    class FakeDatasetReader(DatasetReader):
+        def _read(self, filename: str) -> Iterable[Instance]:
+            for i in range(100):
+                yield Instance({"index": LabelField(i, skip_indexing=True)})
+
+    reader = FakeDatasetReader()
+    dataset = reader.read("blah")
+
+    loader = PyTorchDataLoader(dataset, batch_size=2, num_workers=2)
+    persistent_loader = PyTorchDataLoader(
+        dataset, batch_size=2, num_workers=2, persistent_workers=True
+    )
+    assert persistent_loader.persistent_workers
+    for _ in range(2):
+        batches = [batch["index"].tolist() for batch in loader]
+        persistent_batches = [batch["index"].tolist() for batch in persistent_loader]
+        assert len(persistent_batches) == 50
+        assert persistent_batches == batches
@@ -10,14 +10,14 @@ import torch.distributed as dist
 from allennlp.common.testing import AllenNlpTestCase
 from allennlp.common import util as common_util
 from allennlp.common.checks import ConfigurationError
-from allennlp.data import Instance
+from allennlp.data import Instance, Vocabulary
 from allennlp.data.dataloader import PyTorchDataLoader
 from allennlp.data.dataset_readers import (
     dataset_reader,
     DatasetReader,
     TextClassificationJsonReader,
 )
-from allennlp.data.dataset_readers.dataset_reader import AllennlpLazyDataset
+from allennlp.data.dataset_readers.dataset_reader import AllennlpDataset, AllennlpLazyDataset
 from allennlp.data.fields import LabelField
 
 
@@ -273,6 +273,42 @@ class TestDatasetReader(AllenNlpTestCase):
         instances = list(reader.read(data_file))
         assert len(instances) == 2
 
+    def test_dataset_only_indexes_instances_once(self, monkeypatch):
+        data_file = (
+            AllenNlpTestCase.FIXTURES_ROOT
+            / "data"
+            / "text_classification_json"
+            / "imdb_corpus.jsonl"
+        )
+        reader = TextClassificationJsonReader()
+        vocab = Vocabulary.from_instances(reader.read(data_file))
+
+        index_calls = []
+        original_index_fields = Instance.index_fields
+
+        def index_fields(instance, vocab):
+            index_calls.append(instance)
+            original_index_fields(instance, vocab)
+
+        monkeypatch.setattr(Instance, "index_fields", index_fields)
+
+        # When the vocab is given up front, instances are indexed as they're accessed.
+        instances = AllennlpDataset(list(reader.read(data_file)), vocab)
+        for _ in range(2):
+            for i in range(len(instances)):
+                assert instances[i].indexed
+        assert len(index_calls) == len(instances)
+
+        # With `index_with()`, they're all indexed right away.
+        index_calls.clear()
+        instances = reader.read(data_file)
+        instances.index_with(vocab)
+        assert len(index_calls) == len(instances)
+        assert all(instance.indexed for instance in instances)
+        for i in range(len(instances)):
+            assert instances[i].indexed
+        assert len(index_calls) == len(instances)
+
 
 class MockWorkerInfo(NamedTuple):
     id: int
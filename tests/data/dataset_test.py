@@ -1,5 +1,6 @@
 import pytest
 import numpy
+import torch
 
 from allennlp.common.checks import ConfigurationError
 from allennlp.common.testing import AllenNlpTestCase
@@ -48,6 +49,86 @@ class TestDataset(AllenNlpTestCase):
             text2, numpy.array([[2, 3, 4, 1, 5, 6], [2, 3, 1, 0, 0, 0]])
         )
 
+    def test_as_tensor_dict_batches_label_and_text_fields_directly(self):
+        instances = self.instances
+        for i, instance in enumerate(instances):
+            instance.add_field("label", LabelField(i, skip_indexing=True))
+        dataset = Batch(instances)
+        dataset.index_instances(self.vocab)
+
+        padding_lengths = {"text1": {"tokens___tokens": 3}, "text2": {"tokens___tokens": 7}}
+        tensors = dataset.as_tensor_dict(padding_lengths)
+
+        # This should match what we get from going through each field's own `as_tensor()`.
+        lengths_to_use = {**dataset.get_padding_lengths(), **padding_lengths}
+        for field_name, field in instances[0].fields.items():
+            expected = field.batch_tensors(
+                [
+                    instance[field_name].as_tensor(lengths_to_use.get(field_name, {}))
+                    for instance in instances
+                ]
+            )
+            if field_name == "label":
+                assert tensors[field_name].dtype == expected.dtype
+                assert tensors[field_name].tolist() == expected.tolist()
+            else:
+                actual_tokens = tensors[field_name]["tokens"]["tokens"]
+                expected_tokens = expected["tokens"]["tokens"]
+                assert actual_tokens.dtype == expected_tokens.dtype
+                assert actual_tokens.tolist() == expected_tokens.tolist()
+        assert tensors["text1"]["tokens"]["tokens"].tolist() == [[2, 3, 4], [1, 3, 4]]
+        assert tensors["label"].tolist() == [0, 1]
+
+    def test_batch_fields_directly_falls_back_for_unsupported_fields(self):
+        class MyLabelField(LabelField):
+            pass
+
+        class MyTextField(TextField):
+            pass
+
+        labels = [MyLabelField(0, skip_indexing=True), LabelField(1, skip_indexing=True)]
+        assert labels[1].batch_fields_directly(labels, {}) is None
+        # Fields that haven't been indexed are left to `as_tensor()`.
+        labels = [LabelField("a"), LabelField(1, skip_indexing=True)]
+        assert labels[1].batch_fields_directly(labels, {}) is None
+        labels = [LabelField(0, skip_indexing=True), LabelField(1, skip_indexing=True)]
+        assert labels[0].batch_fields_directly(labels, {}).tolist() == [0, 1]
+
+        tokens = [Token(t) for t in ["this", "is"]]
+        lengths = {"tokens___tokens": 2}
+        texts = [TextField(tokens, self.token_indexer), MyTextField(tokens, self.token_indexer)]
+        for text in texts:
+            text.index(self.vocab)
+        assert texts[0].batch_fields_directly(texts, lengths) is None
+        # Instances with different indexers can't be batched together directly.
+        texts = [
+            TextField(tokens, self.token_indexer),
+            TextField(tokens, {"tokens": SingleIdTokenIndexer(lowercase_tokens=True)}),
+        ]
+        for text in texts:
+            text.index(self.vocab)
+        assert texts[0].batch_fields_directly(texts, lengths) is None
+        texts[1]._token_indexers = {"tokens": SingleIdTokenIndexer()}
+        assert texts[0].batch_fields_directly(texts, lengths)["tokens"]["tokens"].tolist() == [
+            [2, 3],
+            [2, 3],
+        ]
+
+    def test_as_tensor_dict_keeps_bool_token_ids_without_namespace(self):
+        indexers = {"tokens": SingleIdTokenIndexer(namespace=None, feature_name="text_id")}
+        instances = [
+            Instance({"text": TextField([Token("a", text_id=True)], indexers)}),
+            Instance({"text": TextField([Token("b", text_id=False)] * 2, indexers)}),
+        ]
+        assert not indexers["tokens"].can_batch_directly()
+        dataset = Batch(instances)
+        dataset.index_instances(self.vocab)
+        text = instances[0]["text"]
+        assert text.batch_fields_directly([i["text"] for i in instances], {}) is None
+        tensor = dataset.as_tensor_dict()["text"]["tokens"]["tokens"]
+        assert tensor.dtype == torch.bool
+        assert tensor.tolist() == [[True, False], [False, False]]
+
     def get_instances(self):
         field1 = TextField(
             [Token(t) for t in ["this", "is", "a", "sentence", "."]], self.token_indexer
@@ -1476,9 +1476,11 @@ class TestNnUtil(AllenNlpTestCase):
         class FakeTensor(torch.Tensor):
             def __init__(self):
                 self._device = None
+                self._non_blocking = None
 
-            def cuda(self, device):
+            def cuda(self, device, non_blocking=False):
                 self._device = device
+                self._non_blocking = non_blocking
                 return self
 
         class A(NamedTuple):
@@ -1499,6 +1501,11 @@ class TestNnUtil(AllenNlpTestCase):
         assert moved_obj["c"][0] == 1
         assert moved_obj["c"][1]._device == new_device
 
+        moved_obj = util.move_to_device(structured_obj, new_device, non_blocking=True)
+        assert moved_obj["a"][0].b._non_blocking
+        assert moved_obj["b"]._non_blocking
+        assert moved_obj["c"][1]._non_blocking
+
     def test_extend_layer(self):
         lin_layer = torch.nn.Linear(10, 5)
         new_dim = 8